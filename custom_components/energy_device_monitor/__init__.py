@@ -5,9 +5,8 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryError
 
-from .const import CONF_HIGH_TARIFF_ENTITY, CONF_LOW_TARIFF_ENTITY
+from .controller import Controller
 
 _PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -19,12 +18,9 @@ async def async_setup_entry(
 ) -> bool:
     """Set up Energy device monitor from a config entry."""
 
-    try:
-        i = 0
-    except Exception as ex:
-        raise ConfigEntryError("Cannot setup controller") from ex
-
-    entry.runtime_data = None
+    controller = Controller(hass, entry)
+    entry.runtime_data = controller
+    entry.async_on_unload(controller.async_start())
 
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
 
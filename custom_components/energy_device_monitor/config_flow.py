@@ -31,14 +31,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_ENTITY_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=[SENSOR_DOMAIN, INPUT_NUMBER_DOMAIN]),
+)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_LOW_TARIFF_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=[SENSOR_DOMAIN, INPUT_NUMBER_DOMAIN]),
-        ),
-        vol.Required(CONF_HIGH_TARIFF_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=[SENSOR_DOMAIN, INPUT_NUMBER_DOMAIN]),
-        ),
+        vol.Required(CONF_LOW_TARIFF_ENTITY): _ENTITY_SELECTOR,
+        vol.Required(CONF_HIGH_TARIFF_ENTITY): _ENTITY_SELECTOR,
     }
 )
 
@@ -87,12 +87,9 @@ class ConfigFlow(ConfigFlow, domain=DOMAIN):
 SUB_STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_DEVICE_NAME): str,
-        vol.Required(CONF_DEVICE_KEY): str, vol.Required(CONF_LOW_CONSUMPTION_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=[SENSOR_DOMAIN, INPUT_NUMBER_DOMAIN]),
-        ),
-        vol.Required(CONF_HIGH_CONSUMPTION_ENTITY): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=[SENSOR_DOMAIN, INPUT_NUMBER_DOMAIN]),
-        ),
+        vol.Required(CONF_DEVICE_KEY): str,
+        vol.Required(CONF_LOW_CONSUMPTION_ENTITY): _ENTITY_SELECTOR,
+        vol.Required(CONF_HIGH_CONSUMPTION_ENTITY): _ENTITY_SELECTOR,
     }
 )
 
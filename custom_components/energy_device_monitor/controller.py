@@ -0,0 +1,87 @@
+"""Controller for the Energy device monitor integration."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    CONF_HIGH_CONSUMPTION_ENTITY,
+    CONF_HIGH_TARIFF_ENTITY,
+    CONF_LOW_CONSUMPTION_ENTITY,
+    CONF_LOW_TARIFF_ENTITY,
+    DOMAIN,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class EnergyDeviceEntityState:  # noqa: D101
+    available: bool
+    state: float | None = None
+
+
+_UNAVAILABLE = EnergyDeviceEntityState(available=False)
+
+
+def _parse_state(state: State | None) -> EnergyDeviceEntityState:
+    """Parse a source entity state into its numeric value."""
+    if state is None or state.state is None or state.state == STATE_UNAVAILABLE:
+        return _UNAVAILABLE
+    try:
+        return EnergyDeviceEntityState(state=float(state.state), available=True)
+    except ValueError:
+        return _UNAVAILABLE
+
+
+class Controller:
+    """Track the source entities of a config entry and notify its sensors."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the controller."""
+        self.hass = hass
+        self.states: dict[str, EnergyDeviceEntityState] = {}
+
+        entity_ids = {
+            entry.data[CONF_LOW_TARIFF_ENTITY],
+            entry.data[CONF_HIGH_TARIFF_ENTITY],
+        }
+        for subentry in entry.subentries.values():
+            if subentry.subentry_type != "device":
+                continue
+            entity_ids.add(subentry.data[CONF_LOW_CONSUMPTION_ENTITY])
+            entity_ids.add(subentry.data[CONF_HIGH_CONSUMPTION_ENTITY])
+        self._entity_ids = list(entity_ids)
+        self.signals: dict[str, str] = {
+            entity_id: f"{DOMAIN}_{entry.entry_id}_updated_{entity_id}"
+            for entity_id in self._entity_ids
+        }
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Snapshot the source entities and start tracking their changes."""
+        self.states = {
+            entity_id: _parse_state(self.hass.states.get(entity_id))
+            for entity_id in self._entity_ids
+        }
+        return async_track_state_change_event(
+            self.hass, self._entity_ids, self._handle_state_change
+        )
+
+    @callback
+    def _handle_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Cache the new state of a source entity and notify the sensors."""
+        entity_id = event.data["entity_id"]
+        self.states[entity_id] = _parse_state(event.data["new_state"])
+        async_dispatcher_send(self.hass, self.signals[entity_id])
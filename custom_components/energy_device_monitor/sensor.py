@@ -1,8 +1,8 @@
 """Energy device monitor sensor entities for Home Assistant."""
 
-from dataclasses import dataclass
-from datetime import datetime, time
-import zoneinfo
+from collections.abc import Callable
+from datetime import datetime
+from functools import partial
 
 from homeassistant.components.sensor import (
     ENTITY_ID_FORMAT,
@@ -11,11 +11,12 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigSubentry
-from homeassistant.const import STATE_UNAVAILABLE, UnitOfEnergy
-from homeassistant.core import HomeAssistant
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import generate_entity_id
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.util import dt as dt_util
 
 from . import EnergyDeviceMonitorConfigEntry
 from .const import (
@@ -27,11 +28,32 @@ from .const import (
     CONF_LOW_TARIFF_ENTITY,
 )
 
+_LOW_TARIFF = 0
+_HIGH_TARIFF = 1
+_LOW_CONSUMPTION = 2
+_HIGH_CONSUMPTION = 3
 
-@dataclass
-class EnergyDeviceEntityState:  # noqa: D101
-    available: bool
-    state: float | None = None
+
+def _total_cost(values: list[float | None]) -> float:
+    """Return the total cost over both tariffs."""
+    return (values[_LOW_TARIFF] * values[_LOW_CONSUMPTION]) + (
+        values[_HIGH_TARIFF] * values[_HIGH_CONSUMPTION]
+    )
+
+
+def _low_cost(values: list[float | None]) -> float:
+    """Return the cost at the low tariff."""
+    return values[_LOW_TARIFF] * values[_LOW_CONSUMPTION]
+
+
+def _high_cost(values: list[float | None]) -> float:
+    """Return the cost at the high tariff."""
+    return values[_HIGH_TARIFF] * values[_HIGH_CONSUMPTION]
+
+
+def _total_consumption(values: list[float | None]) -> float:
+    """Return the consumption over both tariffs."""
+    return values[_LOW_CONSUMPTION] + values[_HIGH_CONSUMPTION]
 
 
 async def async_setup_entry(
@@ -52,9 +74,7 @@ async def async_setup_entry(
             TotalDailyConsumptionSensor(hass, entry, subentry),
         ]
 
-        async_add_entities(
-            entities, update_before_add=True, config_subentry_id=subentry.subentry_id
-        )
+        async_add_entities(entities, config_subentry_id=subentry.subentry_id)
 
 
 class EnergyDeviceMonitorSensor(SensorEntity):
@@ -66,22 +86,20 @@ class EnergyDeviceMonitorSensor(SensorEntity):
     _subentry: ConfigSubentry
     _device_name: str
     _device_key: str
+    _value_fn: Callable[[list[float | None]], float]
 
-    _include_low_consumption: bool
-    _include_high_consumption: bool
-    _include_low_tariff: bool
-    _include_high_tariff: bool
+    _tracked: tuple[tuple[str, int], ...]
+    _last_written: tuple[bool, float | None] | None = None
 
-    low_tariff_state: EnergyDeviceEntityState
-    high_tariff_state: EnergyDeviceEntityState
-    low_consumption_state: EnergyDeviceEntityState
-    high_consumption_state: EnergyDeviceEntityState
+    _avail: list[bool]
+    _values: list[float | None]
 
     def __init__(
         self,
         hass: HomeAssistant,
         entry: EnergyDeviceMonitorConfigEntry,
         subentry: ConfigSubentry,
+        value_fn: Callable[[list[float | None]], float],
         include_low_consumption: bool = False,
         include_high_consumption: bool = False,
         include_low_tariff: bool = False,
@@ -93,62 +111,88 @@ class EnergyDeviceMonitorSensor(SensorEntity):
         self._subentry = subentry
         self._device_name = subentry.data[CONF_DEVICE_NAME]
         self._device_key = subentry.data[CONF_DEVICE_KEY]
-        self._include_low_consumption = include_low_consumption
-        self._include_high_consumption = include_high_consumption
-        self._include_low_tariff = include_low_tariff
-        self._include_high_tariff = include_high_tariff
-    
-        self._attr_translation_placeholders = {"device_name": self._device_name.lower()}
+        self._value_fn = value_fn
 
-        entities_to_track = []
-        if include_low_tariff:
-            entities_to_track.append(entry.data[CONF_LOW_TARIFF_ENTITY])
-        if include_high_tariff:
-            entities_to_track.append(entry.data[CONF_HIGH_TARIFF_ENTITY])
-        if include_low_consumption:
-            entities_to_track.append(subentry.data[CONF_LOW_CONSUMPTION_ENTITY])
-        if include_high_consumption:
-            entities_to_track.append(subentry.data[CONF_HIGH_CONSUMPTION_ENTITY])
-
-        async_track_state_change_event(
-            self.hass,
-            entities_to_track,
-            self._handle_state_change,
-        )
-
-    async def _handle_state_change(self, event) -> None:
-        await self.async_update_ha_state(True)
+        self._attr_translation_placeholders = {"device_name": self._device_name.lower()}
 
-    async def async_update(self) -> None:
-        """Update the sensor state."""
-        if self._include_low_tariff:
-            self.low_tariff_state = await self._async_update_entity_state(
-                self._entry.data[CONF_LOW_TARIFF_ENTITY]
-            )
-        if self._include_high_tariff:
-            self.high_tariff_state = await self._async_update_entity_state(
-                self._entry.data[CONF_HIGH_TARIFF_ENTITY]
-            )
-        if self._include_low_consumption:
-            self.low_consumption_state = await self._async_update_entity_state(
-                self._subentry.data[CONF_LOW_CONSUMPTION_ENTITY]
+        self._tracked = tuple(
+            (entity_id, index)
+            for include, entity_id, index in (
+                (include_low_tariff, entry.data[CONF_LOW_TARIFF_ENTITY], _LOW_TARIFF),
+                (
+                    include_high_tariff,
+                    entry.data[CONF_HIGH_TARIFF_ENTITY],
+                    _HIGH_TARIFF,
+                ),
+                (
+                    include_low_consumption,
+                    subentry.data[CONF_LOW_CONSUMPTION_ENTITY],
+                    _LOW_CONSUMPTION,
+                ),
+                (
+                    include_high_consumption,
+                    subentry.data[CONF_HIGH_CONSUMPTION_ENTITY],
+                    _HIGH_CONSUMPTION,
+                ),
             )
-        if self._include_high_consumption:
-            self.high_consumption_state = await self._async_update_entity_state(
-                self._subentry.data[CONF_HIGH_CONSUMPTION_ENTITY]
+            if include
+        )
+        self._avail = [False] * 4
+        self._values = [None] * 4
+
+    async def async_added_to_hass(self) -> None:
+        """Take an initial snapshot and listen for controller updates."""
+        await super().async_added_to_hass()
+        self._recalculate()
+        self._last_written = (self._attr_available, self._attr_native_value)
+        indices: dict[str, tuple[int, ...]] = {}
+        for entity_id, index in self._tracked:
+            indices[entity_id] = (*indices.get(entity_id, ()), index)
+
+        signals = self._entry.runtime_data.signals
+        for entity_id, entity_indices in indices.items():
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    signals[entity_id],
+                    partial(self._handle_state_change, entity_id, entity_indices),
+                )
             )
 
-    async def _async_update_entity_state(
-        self, entity_id: str
-    ) -> EnergyDeviceEntityState:
-        """Helper to update and return the state for a given entity ID."""
-        state = self.hass.states.get(entity_id)
-        if state is None or state.state is None or state.state == STATE_UNAVAILABLE:
-            return EnergyDeviceEntityState(available=False)
-        try:
-            return EnergyDeviceEntityState(state=float(state.state), available=True)
-        except ValueError:
-            return EnergyDeviceEntityState(available=False)
+    @callback
+    def _handle_state_change(
+        self, entity_id: str, indices: tuple[int, ...]
+    ) -> None:
+        """Handle a state change of one of the source entities."""
+        state = self._entry.runtime_data.states[entity_id]
+        for index in indices:
+            self._avail[index] = state.available
+            self._values[index] = state.state
+
+        self._update_state_attrs()
+        key = (self._attr_available, self._attr_native_value)
+        if key == self._last_written:
+            return
+        self._last_written = key
+        self.async_write_ha_state()
+
+    @callback
+    def _recalculate(self) -> None:
+        """Read the cached states of the tracked entities from the controller."""
+        states = self._entry.runtime_data.states
+        for entity_id, index in self._tracked:
+            state = states[entity_id]
+            self._avail[index] = state.available
+            self._values[index] = state.state
+        self._update_state_attrs()
+
+    @callback
+    def _update_state_attrs(self) -> None:
+        """Recompute the cached availability and value from the tracked states."""
+        self._attr_available = all(self._avail[index] for _, index in self._tracked)
+        self._attr_native_value = (
+            self._value_fn(self._values) if self._attr_available else None
+        )
 
 
 class TotalDailyCostSensor(EnergyDeviceMonitorSensor):
@@ -167,6 +211,7 @@ class TotalDailyCostSensor(EnergyDeviceMonitorSensor):
             hass,
             entry,
             sub_entry,
+            _total_cost,
             include_low_tariff=True,
             include_low_consumption=True,
             include_high_tariff=True,
@@ -181,29 +226,10 @@ class TotalDailyCostSensor(EnergyDeviceMonitorSensor):
         self._attr_suggested_display_precision = 2
         self._attr_state_class = SensorStateClass.TOTAL
 
-
-    @property
-    def available(self) -> bool:
-        """Return if the sensor is available."""
-        return (
-            self.low_tariff_state.available
-            and self.high_tariff_state.available
-            and self.low_consumption_state.available
-            and self.high_consumption_state.available
-        )
-
-    @property
-    def native_value(self) -> float:
-        """Return the current value of the sensor."""
-        return (self.low_tariff_state.state * self.low_consumption_state.state) + (
-            self.high_tariff_state.state * self.high_consumption_state.state
-        )
-
     @property
     def last_reset(self) -> datetime:
         """Return the last reset time for the sensor."""
-        tz = zoneinfo.ZoneInfo(self.hass.config.time_zone)
-        return datetime.combine(datetime.now(tz).date(), time.min, tzinfo=tz)
+        return dt_util.start_of_local_day()
 
 
 class DailyLowCostSensor(EnergyDeviceMonitorSensor):
@@ -222,6 +248,7 @@ class DailyLowCostSensor(EnergyDeviceMonitorSensor):
             hass,
             entry,
             sub_entry,
+            _low_cost,
             include_low_tariff=True,
             include_low_consumption=True,
         )
@@ -233,16 +260,6 @@ class DailyLowCostSensor(EnergyDeviceMonitorSensor):
         self._attr_native_unit_of_measurement = "EUR"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def available(self) -> bool:
-        """Return if the sensor is available."""
-        return self.low_tariff_state.available and self.low_consumption_state.available
-
-    @property
-    def native_value(self) -> float:
-        """Return the current value of the sensor."""
-        return self.low_tariff_state.state * self.low_consumption_state.state
-
 
 class DailyHighCostSensor(EnergyDeviceMonitorSensor, SensorEntity):
     """Representation of a daily high cost sensor for the energy device monitor."""
@@ -260,6 +277,7 @@ class DailyHighCostSensor(EnergyDeviceMonitorSensor, SensorEntity):
             hass,
             entry,
             sub_entry,
+            _high_cost,
             include_high_tariff=True,
             include_high_consumption=True,
         )
@@ -271,18 +289,6 @@ class DailyHighCostSensor(EnergyDeviceMonitorSensor, SensorEntity):
         self._attr_native_unit_of_measurement = "EUR"
         self._attr_suggested_display_precision = 2
 
-    @property
-    def available(self) -> bool:
-        """Return if the sensor is available."""
-        return (
-            self.high_tariff_state.available and self.high_consumption_state.available
-        )
-
-    @property
-    def native_value(self) -> float:
-        """Return the current value of the sensor."""
-        return self.high_tariff_state.state * self.high_consumption_state.state
-
 
 class TotalDailyConsumptionSensor(EnergyDeviceMonitorSensor, SensorEntity):
     """Representation of a total daily consumption sensor for the energy device monitor."""
@@ -300,6 +306,7 @@ class TotalDailyConsumptionSensor(EnergyDeviceMonitorSensor, SensorEntity):
             hass,
             entry,
             sub_entry,
+            _total_consumption,
             include_low_consumption=True,
             include_high_consumption=True,
         )
@@ -311,16 +318,3 @@ class TotalDailyConsumptionSensor(EnergyDeviceMonitorSensor, SensorEntity):
         self._attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
         self._attr_suggested_display_precision = 3
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-
-    @property
-    def available(self) -> bool:
-        """Return if the sensor is available."""
-        return (
-            self.low_consumption_state.available
-            and self.high_consumption_state.available
-        )
-
-    @property
-    def native_value(self) -> float:
-        """Return the current value of the sensor."""
-        return self.low_consumption_state.state + self.high_consumption_state.state